@@ -84,6 +84,7 @@ def scan(
         counts,
         cfg.get("report", {}).get("formats", ["cli"]),
         cfg.get("report", {}).get("output_dir", "build/speclint"),
+        cfg.get("report", {}).get("html_chunk_size", 5000),
     )
 
     raise typer.Exit(code=1 if counts.get("error", 0) > 0 else 0)
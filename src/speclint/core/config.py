@@ -31,7 +31,16 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "AMBIGUOUS_TERMS": {"severity": "warning", "languages": ["en", "pl"]},
         "DOC_METADATA": "info",
     },
-    "report": {"formats": ["cli", "markdown", "json"], "output_dir": "build/speclint"},
+    "report": {
+        "formats": ["cli", "markdown", "json"],
+        "output_dir": "build/speclint",
+        "max_findings_per_rule": 0,     # 0 = unlimited; the rest is summarized as "and N more"
+        "aggregate": False,             # one entry per (rule, file) instead of per finding
+        "html_chunk_size": 5000,        # findings per lazily loaded chunk of the "html" report
+    },
+    # workers > 1 (0 = all CPUs) checks per-requirement rules in a process pool, chunk_size reqs
+    # per task; only used with more than one CPU, and findings are still built in this process.
+    "engine": {"workers": 1, "chunk_size": 20000},
     "nlp": {"language_priority": ["pl", "en"]},
     "junit": {"paths": []},
     "inputs": {
@@ -73,6 +82,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
             "header_regex": r"^##\s+(REQ-[0-9]+)\s+(.*)$",
             "risk_regex": r"^risk:\s*(\w+)",
             "tests_regex": r"^tests:\s*(.*)$",
+            "tags_regex": r"^tags:\s*(.*)$",
         },
     },
 }
@@ -85,7 +95,7 @@ def load_config(path: str | None) -> Dict[str, Any]:
         data = yaml.safe_load(f) or {}
     cfg = DEFAULT_CONFIG.copy()
     cfg.update(data)
-    for key in ("id_formats", "rules", "report", "junit", "inputs"):
+    for key in ("id_formats", "rules", "report", "engine", "junit", "inputs"):
         if key in data and isinstance(DEFAULT_CONFIG.get(key), dict):
             merged = DEFAULT_CONFIG[key].copy()
             _deep_update(merged, data[key])
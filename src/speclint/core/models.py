@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import List, Optional, Set
-from pydantic import BaseModel
+from typing import Any, Dict, List, Optional, Set
+from pydantic import BaseModel, Field, model_serializer, model_validator
 
 class Requirement(BaseModel):
     id: str
     title: str
+    description: Optional[str] = None
     risk: Optional[str] = None
     tests: List[str] = []
     tags: List[str] = []
@@ -20,10 +21,38 @@ class TestCase(BaseModel):
 class Finding(BaseModel):
     rule_id: str
     severity: str   # error|warning|info
-    message: str
+    # str.format template + args, rendered lazily via `message`; not serialized.
+    # A plain `message=...` is accepted too (and is what model_dump() emits).
+    template: str = Field(exclude=True)
+    args: Dict[str, Any] = Field(default_factory=dict, exclude=True)
     file: Optional[str] = None
     line: Optional[int] = None
     related_ids: List[str] = []
+    count: int = 1  # underlying findings this entry stands for (caps/aggregation)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _message_to_template(cls, data: Any) -> Any:
+        if isinstance(data, dict) and "template" not in data and "message" in data:
+            data = dict(data)
+            msg = str(data.pop("message"))
+            data["template"] = msg.replace("{", "{{").replace("}", "}}")
+        return data
+
+    @property
+    def message(self) -> str:
+        return self.template.format(**self.args)
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler) -> Dict[str, Any]:
+        # keep the original public shape: message third, `count` only when it is not 1
+        data = handler(self)
+        out = {"rule_id": data["rule_id"], "severity": data["severity"], "message": self.message}
+        for key in ("file", "line", "related_ids"):
+            out[key] = data[key]
+        if self.count != 1:
+            out["count"] = self.count
+        return out
 
 class Model(BaseModel):
     requirements: List[Requirement] = []
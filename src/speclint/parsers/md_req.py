@@ -4,39 +4,116 @@ from pathlib import Path
 import re
 from speclint.core.models import Requirement
 
+_SPLIT_RE = re.compile(r"[,\|]")
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+def _literal_prefix(pattern: str, ignore_case: bool) -> str:
+    """
+    Return the literal text every match of a '^'-anchored pattern must start with.
+    Used as a cheap prefilter so prose lines never reach the regex engine.
+    Returns '' (no prefilter) when the prefix cannot be determined safely.
+    """
+    if not pattern.startswith("^") or "|" in pattern:
+        return ""
+    prefix: list[str] = []
+    for ch in pattern[1:]:
+        if ch in _REGEX_META:
+            # a quantifier makes the preceding char optional/repeatable
+            if ch in "*?{" and prefix:
+                prefix.pop()
+            break
+        prefix.append(ch)
+    text = "".join(prefix)
+    return text.lower() if ignore_case else text
+
+def _split_values(raw: str) -> List[str]:
+    return [t.strip() for t in _SPLIT_RE.split(raw) if t.strip()]
+
 def parse_md_requirements(path: Path, cfg: Dict[str, Any]) -> List[Requirement]:
     """
-    Markdown parser with configurable regexes for header, risk and tests lines.
-    Config path: inputs.md.header_regex, inputs.md.risk_regex, inputs.md.tests_regex
+    Markdown parser with configurable regexes for header, risk, tests and tags lines.
+    Config path: inputs.md.header_regex, inputs.md.risk_regex, inputs.md.tests_regex,
+    inputs.md.tags_regex
     The header regex must capture (id, title) in groups 1 and 2.
+    Other non-empty lines under a header, up to the next Markdown heading, are collected
+    into the requirement description.
     """
     mdcfg = (cfg.get("inputs", {}) or {}).get("md", {}) or {}
-    header_re = re.compile(mdcfg.get("header_regex", r"^##\s+(REQ-[0-9]+)\s+(.*)$"))
-    risk_re = re.compile(mdcfg.get("risk_regex", r"^risk:\s*(\w+)"), re.I)
-    tests_re = re.compile(mdcfg.get("tests_regex", r"^tests:\s*(.*)$"), re.I)
+    header_src = mdcfg.get("header_regex", r"^##\s+(REQ-[0-9]+)\s+(.*)$")
+    risk_src = mdcfg.get("risk_regex", r"^risk:\s*(\w+)")
+    tests_src = mdcfg.get("tests_regex", r"^tests:\s*(.*)$")
+    tags_src = mdcfg.get("tags_regex", r"^tags:\s*(.*)$")
+    header_re = re.compile(header_src)
+    risk_re = re.compile(risk_src, re.I)
+    tests_re = re.compile(tests_src, re.I)
+    tags_re = re.compile(tags_src, re.I)
+
+    # Cheap startswith() checks run first; the regex only runs on candidate lines.
+    header_pre = _literal_prefix(header_src, ignore_case=False)
+    field_pres = [
+        (_literal_prefix(risk_src, ignore_case=True), risk_re, "risk"),
+        (_literal_prefix(tests_src, ignore_case=True), tests_re, "tests"),
+        (_literal_prefix(tags_src, ignore_case=True), tags_re, "tags"),
+    ]
+    # First characters a field line can start with; None disables the shortcut.
+    field_starts: set[str] | None = set()
+    for pre, _, _ in field_pres:
+        if not pre:
+            field_starts = None
+            break
+        field_starts.update((pre[0], pre[0].upper()))
 
     out: List[Requirement] = []
-    current: Requirement | None = None
+    current: Dict[str, Any] | None = None
+    body: List[str] = []
+    in_body = False  # description ends at the first non-requirement heading
+
+    def flush() -> None:
+        if current is None:
+            return
+        current["description"] = "\n".join(body).strip() or None
+        out.append(Requirement(**current))
+
     with open(path, "r", encoding="utf-8") as f:
         for lineno, line in enumerate(f, start=1):
             s = line.strip()
-            hm = header_re.match(s)
-            if hm:
-                if current:
-                    out.append(current)
-                current = Requirement(id=hm.group(1), title=hm.group(2).strip(), file=str(path), line=lineno)
+            if not s:
+                if in_body and body:
+                    body.append("")
                 continue
-            if not current:
+            if not header_pre or s.startswith(header_pre):
+                hm = header_re.match(s)
+                if hm:
+                    flush()
+                    current = {"id": hm.group(1), "title": hm.group(2).strip(),
+                               "file": str(path), "line": lineno}
+                    body = []
+                    in_body = True
+                    continue
+            if current is None:
                 continue
-            rm = risk_re.match(s)
-            if rm:
-                current.risk = rm.group(1).lower()
+            if field_starts is not None and s[0] not in field_starts:
+                if s[0] == "#":
+                    in_body = False
+                elif in_body:
+                    body.append(s)
                 continue
-            tm = tests_re.match(s)
-            if tm:
-                import re as _re
-                tests = [t.strip() for t in _re.split(r"[,\|]", tm.group(1)) if t.strip()]
-                current.tests = tests
-    if current:
-        out.append(current)
-    return out
\ No newline at end of file
+            low = s.lower()
+            for pre, rx, field in field_pres:
+                if pre and not low.startswith(pre):
+                    continue
+                m = rx.match(s)
+                if not m:
+                    continue
+                if field == "risk":
+                    current["risk"] = m.group(1).lower()
+                else:
+                    current[field] = _split_values(m.group(1))
+                break
+            else:
+                if s[0] == "#":
+                    in_body = False
+                elif in_body:
+                    body.append(s)
+    flush()
+    return out
@@ -1,9 +1,23 @@
 from __future__ import annotations
-from typing import List, Dict, Any
-import yaml
+from typing import List, Dict, Any, Iterator, Tuple
+import re
+from yaml.composer import ComposerError
+from yaml.events import (
+    AliasEvent, ScalarEvent, SequenceStartEvent, SequenceEndEvent,
+    MappingStartEvent, MappingEndEvent, DocumentStartEvent, StreamEndEvent,
+)
+from yaml.nodes import Node, ScalarNode, SequenceNode, MappingNode
 from pathlib import Path
 from speclint.core.models import Requirement
 
+# libyaml (C) loader when PyYAML was built with it; pure-Python fallback otherwise.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+_SPLIT_RE = re.compile(r"[,\|]")
+
 def _first_present(d: Dict[str, Any], aliases: list[str]) -> Any:
     """Return the first present key from aliases; None if none found."""
     for k in aliases:
@@ -11,6 +25,109 @@ def _first_present(d: Dict[str, Any], aliases: list[str]) -> Any:
             return d[k]
     return None
 
+def _compose(loader: Any, anchors: Dict[str, Node]) -> Node:
+    """
+    Build one node from the event stream (same logic as yaml.composer.Composer).
+    The C parser only exposes events, so composing is done here for both loaders.
+    """
+    event = loader.get_event()
+    if isinstance(event, AliasEvent):
+        if event.anchor not in anchors:
+            raise ComposerError(
+                None, None, f"found undefined alias {event.anchor!r}", event.start_mark)
+        return anchors[event.anchor]
+    if isinstance(event, ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(ScalarNode, event.value, event.implicit)
+        node: Node = ScalarNode(tag, event.value, event.start_mark, event.end_mark,
+                                style=event.style)
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        return node
+    if isinstance(event, SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(SequenceNode, None, event.implicit)
+        node = SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        while not loader.check_event(SequenceEndEvent):
+            node.value.append(_compose(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+        return node
+    if isinstance(event, MappingStartEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(MappingNode, None, event.implicit)
+        node = MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        while not loader.check_event(MappingEndEvent):
+            key = _compose(loader, anchors)
+            node.value.append((key, _compose(loader, anchors)))
+        node.end_mark = loader.get_event().end_mark
+        return node
+    raise ComposerError(
+        None, None, f"unexpected event {event!r}", event.start_mark)
+
+def _construct(loader: Any, node: Node) -> Any:
+    value = loader.construct_object(node, deep=True)
+    # drop constructor caches so memory stays bounded by one record
+    loader.constructed_objects = {}
+    loader.recursive_objects = {}
+    return value
+
+def _iter_sequence(loader: Any, anchors: Dict[str, Node]) -> Iterator[Tuple[Any, int]]:
+    """Yield (python_value, 1-based source line) per item of the sequence at the cursor."""
+    loader.get_event()  # SequenceStartEvent
+    while not loader.check_event(SequenceEndEvent):
+        # line of the item itself, not of the anchor an alias item points to
+        line = loader.peek_event().start_mark.line + 1
+        node = _compose(loader, anchors)
+        yield _construct(loader, node), line
+    loader.get_event()
+
+def _iter_requirement_items(path: Path) -> Iterator[Tuple[Any, int]]:
+    """
+    Stream requirement items from a single-document YAML file without building it whole.
+    Accepts either a top-level list or a mapping with a 'requirements' list.
+    Unlike a full load, every 'requirements' key of the mapping is read (not last-wins).
+    """
+    with open(path, "rb") as f:
+        loader = _Loader(f)
+        try:
+            loader.get_event()  # StreamStartEvent
+            if not loader.check_event(DocumentStartEvent):
+                return
+            loader.get_event()
+            anchors: Dict[str, Node] = {}
+            if loader.check_event(SequenceStartEvent):
+                yield from _iter_sequence(loader, anchors)
+            elif loader.check_event(MappingStartEvent):
+                loader.get_event()
+                while not loader.check_event(MappingEndEvent):
+                    key = _compose(loader, anchors)
+                    is_reqs = isinstance(key, ScalarNode) and key.value == "requirements"
+                    if is_reqs and loader.check_event(SequenceStartEvent):
+                        yield from _iter_sequence(loader, anchors)
+                        continue
+                    value = _compose(loader, anchors)
+                    if is_reqs and isinstance(value, SequenceNode):
+                        # alias to a list anchored earlier in the document
+                        for item in value.value:
+                            yield _construct(loader, item), item.start_mark.line + 1
+                loader.get_event()
+            else:
+                _compose(loader, anchors)
+            loader.get_event()  # DocumentEndEvent
+            if not loader.check_event(StreamEndEvent):
+                event = loader.get_event()
+                raise ComposerError("expected a single document in the stream", None,
+                                    "but found another document", event.start_mark)
+        finally:
+            loader.dispose()
+
 def parse_yaml_requirements(path: Path, cfg: Dict[str, Any]) -> List[Requirement]:
     """
     YAML parser with flexible field aliases.
@@ -19,6 +136,7 @@ def parse_yaml_requirements(path: Path, cfg: Dict[str, Any]) -> List[Requirement
       - {'requirements': [ { ... }, { ... } ]}  OR
       - a plain list: [ { ... }, { ... } ]
     Required fields: id, title, risk. Optional: tests, tags.
+    Items are streamed one at a time; `line` is the item's start line in the file.
     """
     ycfg = ((cfg.get("inputs", {}) or {}).get("yaml", {}) or {}).get("fields", {}) or {}
     # defaults used if user does not override:
@@ -32,15 +150,8 @@ def parse_yaml_requirements(path: Path, cfg: Dict[str, Any]) -> List[Requirement
     for k, v in ycfg.items():
         defaults[k] = list(dict.fromkeys(v))
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
-
-    reqs_data = data.get("requirements", []) if isinstance(data, dict) else data
-    if not isinstance(reqs_data, list):
-        reqs_data = []
-
     out: List[Requirement] = []
-    for idx, raw in enumerate(reqs_data, start=1):
+    for raw, lineno in _iter_requirement_items(path):
         if not isinstance(raw, dict):
             continue
         rid = _first_present(raw, defaults["id"])
@@ -55,15 +166,13 @@ def parse_yaml_requirements(path: Path, cfg: Dict[str, Any]) -> List[Requirement
         elif isinstance(tests, str):
             # NOTE: we do NOT know the separator for YAML strings; users usually use lists,
             # but if it's a string, split on comma/pipe as a convenience.
-            import re
-            tests_list = [t.strip() for t in re.split(r"[,\|]", tests) if t.strip()]
+            tests_list = [t.strip() for t in _SPLIT_RE.split(tests) if t.strip()]
 
         tags_list = []
         if isinstance(tags, list):
             tags_list = [str(t).strip() for t in tags if str(t).strip()]
         elif isinstance(tags, str):
-            import re
-            tags_list = [t.strip() for t in re.split(r"[,\|]", tags) if t.strip()]
+            tags_list = [t.strip() for t in _SPLIT_RE.split(tags) if t.strip()]
 
         out.append(
             Requirement(
@@ -73,7 +182,7 @@ def parse_yaml_requirements(path: Path, cfg: Dict[str, Any]) -> List[Requirement
                 tests=tests_list,
                 tags=tags_list,
                 file=str(path),
-                line=idx,
+                line=lineno,
             )
         )
-    return out
\ No newline at end of file
+    return out
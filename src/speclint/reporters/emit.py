@@ -20,7 +20,166 @@ MD_TEMPLATE = Template(
 """
 )
 
-def write_reports(findings: List[Finding], counts: Dict[str, int], formats: list[str], out_dir: str) -> None:
+HTML_TEMPLATE = Template(
+"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>SpecLint Report</title>
+<style>
+body { font: 14px/1.4 system-ui, sans-serif; margin: 1.5em; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }
+th { background: #f4f4f4; }
+.error { color: #b00020; } .warning { color: #a66300; } .info { color: #1f5fa8; }
+#filters > * { margin-right: .5em; }
+</style>
+</head>
+<body>
+<h1>SpecLint Report</h1>
+<p><strong>Summary:</strong> {{ counts.error }} errors, {{ counts.warning }} warnings, {{ counts.info }} info
+({{ total }} entries in {{ chunks }} chunks).</p>
+<div id="filters">
+  <select id="f-severity"><option value="">all severities</option></select>
+  <select id="f-rule"><option value="">all rules</option></select>
+  <select id="f-file"><option value="">all files</option></select>
+  <input id="f-text" placeholder="filter message">
+  <button id="prev">&larr;</button><span id="page"></span><button id="next">&rarr;</button>
+</div>
+<table>
+<thead><tr><th>Severity</th><th>Rule</th><th>Message</th><th>File</th><th>Line</th><th>Count</th></tr></thead>
+<tbody id="rows"></tbody>
+</table>
+<script>
+// Findings live in data/chunk-NNNNN.js (pre-sorted); data/manifest.js maps every rule,
+// severity and file to the chunks containing it, so only matching chunks are loaded.
+var manifest = null, cache = {}, pending = {}, pages = [], pos = 0, gen = 0, lastShown = -1;
+function speclintManifest(m) { manifest = m; init(); }
+function speclintChunk(id, rows) { cache[id] = rows; (pending[id] || []).forEach(function (cb) { cb(rows); }); delete pending[id]; }
+function load(id, cb) {
+  if (cache[id]) { cb(cache[id]); return; }
+  if (pending[id]) { pending[id].push(cb); return; }
+  pending[id] = [cb];
+  var s = document.createElement("script");
+  s.src = "data/" + manifest.chunks[id].name;
+  document.head.appendChild(s);
+}
+function el(id) { return document.getElementById(id); }
+function fill(sel, index) {
+  Object.keys(index).sort().forEach(function (k) {
+    var o = document.createElement("option");
+    o.value = k; o.textContent = k + " (" + index[k].count + ")";
+    sel.appendChild(o);
+  });
+}
+function filters() {
+  return { severity: el("f-severity").value, rule: el("f-rule").value,
+           file: el("f-file").value, text: el("f-text").value.toLowerCase() };
+}
+function candidates(f) {
+  var ids = manifest.chunks.map(function (_, i) { return i; });
+  ["severity", "rule", "file"].forEach(function (k) {
+    if (!f[k]) return;
+    var allowed = {};
+    manifest.index[k][f[k]].chunks.forEach(function (i) { allowed[i] = true; });
+    ids = ids.filter(function (i) { return allowed[i]; });
+  });
+  return ids;
+}
+function refresh() { pages = candidates(filters()); pos = 0; lastShown = -1; show(1); }
+// dir (+1/-1) is the paging direction: chunks without rows matching the active filters are
+// skipped in that direction (candidates() only narrows per filter, not their combination),
+// so a page is only empty when nothing matches at all.
+function show(dir) {
+  var f = filters(), body = el("rows"), token = ++gen;
+  dir = dir || 1;
+  el("page").textContent = pages.length ? " chunk " + (pos + 1) + " / " + pages.length + " " : " no matches ";
+  body.textContent = "";
+  if (!pages.length) return;
+  load(pages[pos], function (rows) {
+    if (token !== gen) return;  // a newer filter/page request superseded this one
+    var shown = 0;
+    rows.forEach(function (r) {
+      // r = [severity, rule, message, file, line, count]
+      if ((f.severity && r[0] !== f.severity) || (f.rule && r[1] !== f.rule) ||
+          (f.file && (r[3] || "(none)") !== f.file) || (f.text && r[2].toLowerCase().indexOf(f.text) < 0)) return;
+      var tr = document.createElement("tr");
+      r.forEach(function (v, i) {
+        var td = document.createElement("td");
+        td.textContent = v === null ? "" : v;
+        if (i === 0) td.className = v;
+        tr.appendChild(td);
+      });
+      body.appendChild(tr);
+      shown++;
+    });
+    if (shown) lastShown = pos;
+    if (!shown && (f.severity || f.rule || f.file || f.text)) {
+      if (pos + dir >= 0 && pos + dir < pages.length) { pos += dir; show(dir); }
+      else if (lastShown >= 0) { pos = lastShown; show(-dir); }  // no more matches this way
+      else el("page").textContent = " no matches ";
+    }
+  });
+}
+function init() {
+  fill(el("f-severity"), manifest.index.severity);
+  fill(el("f-rule"), manifest.index.rule);
+  fill(el("f-file"), manifest.index.file);
+  ["f-severity", "f-rule", "f-file"].forEach(function (id) { el(id).onchange = refresh; });
+  el("f-text").oninput = function () { pos = 0; lastShown = -1; show(1); };
+  el("prev").onclick = function () { if (pos > 0) { pos--; show(-1); } };
+  el("next").onclick = function () { if (pos < pages.length - 1) { pos++; show(1); } };
+  refresh();
+}
+</script>
+<script src="data/manifest.js"></script>
+</body>
+</html>
+""",
+    autoescape=True,
+)
+
+SEVERITY_ORDER = {"error": 0, "warning": 1, "info": 2}
+
+def write_html_report(findings: List[Finding], counts: Dict[str, int], out_dir: Path, chunk_size: int) -> None:
+    """
+    Static HTML report: a small index.html plus pre-sorted findings split into
+    data/chunk-NNNNN.js files and a data/manifest.js index by rule, severity and file.
+    Chunks are JS callbacks (not JSON) so the page also works when opened from disk.
+    """
+    data_dir = out_dir / "data"
+    data_dir.mkdir(parents=True, exist_ok=True)
+    for old in data_dir.glob("chunk-*.js"):
+        old.unlink()
+
+    ordered = sorted(findings, key=lambda f: (SEVERITY_ORDER.get(f.severity, 99), f.rule_id,
+                                              f.file or "", f.line or 0))
+    chunks: List[Dict] = []
+    index: Dict[str, Dict[str, Dict]] = {"severity": {}, "rule": {}, "file": {}}
+    for start in range(0, len(ordered), chunk_size):
+        cid = len(chunks)
+        rows = []
+        for f in ordered[start:start + chunk_size]:
+            rows.append([f.severity, f.rule_id, f.message, f.file or "", f.line, f.count])
+            for key, value in (("severity", f.severity), ("rule", f.rule_id), ("file", f.file or "(none)")):
+                entry = index[key].setdefault(value, {"count": 0, "chunks": []})
+                entry["count"] += f.count
+                if not entry["chunks"] or entry["chunks"][-1] != cid:
+                    entry["chunks"].append(cid)
+        name = f"chunk-{cid:05d}.js"
+        payload = json.dumps(rows, separators=(",", ":"), ensure_ascii=False)
+        (data_dir / name).write_text(f"speclintChunk({cid},{payload});\n", encoding="utf-8")
+        chunks.append({"name": name, "size": len(rows)})
+
+    manifest = {"counts": counts, "total": len(ordered), "chunks": chunks, "index": index}
+    (data_dir / "manifest.js").write_text(
+        f"speclintManifest({json.dumps(manifest, separators=(',', ':'), ensure_ascii=False)});\n",
+        encoding="utf-8")
+    html = HTML_TEMPLATE.render(counts=counts, total=len(ordered), chunks=len(chunks))
+    (out_dir / "index.html").write_text(html, encoding="utf-8")
+
+def write_reports(findings: List[Finding], counts: Dict[str, int], formats: list[str], out_dir: str,
+                  html_chunk_size: int = 5000) -> None:
     Path(out_dir).mkdir(parents=True, exist_ok=True)
     if "cli" in formats:
         rows = [[f.severity, f.rule_id, f.message, f.file or "", f.line or ""] for f in findings]
@@ -31,4 +190,6 @@ def write_reports(findings: List[Finding], counts: Dict[str, int], formats: list
         (Path(out_dir) / "report.md").write_text(md, encoding="utf-8")
     if "json" in formats:
         data = {"findings": [f.model_dump() for f in findings], "counts": counts}
-        (Path(out_dir) / "report.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
\ No newline at end of file
+        (Path(out_dir) / "report.json").write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if "html" in formats:
+        write_html_report(findings, counts, Path(out_dir) / "html", max(1, int(html_chunk_size or 5000)))
@@ -1,86 +1,256 @@
 from __future__ import annotations
-from typing import Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from operator import attrgetter
+import os
 import re
-from speclint.core.models import Model, Finding
+from speclint.core.models import Model, Finding, Requirement
+
+_SEQ_RE = re.compile(r"(\d+)$")
+_LEX_PL = frozenset({"powinno", "może", "szybko", "łatwo", "intuicyjne"})
+_LEX_EN = frozenset({"should", "may", "quickly", "easily", "user-friendly", "robust"})
+# Bits of the per-requirement check mask (see _make_checker).
+_BAD_ID, _MISSING_FIELDS, _NO_TESTS, _LOW_COVERAGE, _AMBIGUOUS = 1, 2, 4, 8, 16
+_CLEAN: Tuple[int, List[str]] = (0, [])
 
 def run_rules(model: Model, cfg: Dict) -> Tuple[List[Finding], Dict[str, int]]:
     findings: List[Finding] = []
     counts = {"error": 0, "warning": 0, "info": 0}
 
-    def emit(rule_id: str, severity: str, message: str, file: str | None = None, line: int | None = None, related=None):
-        f = Finding(rule_id=rule_id, severity=severity, message=message, file=file, line=line, related_ids=related or [])
-        findings.append(f)
+    # report.max_findings_per_rule caps stored entries per rule (0 = unlimited);
+    # report.aggregate groups them by (rule, file), and the cap then limits groups per rule.
+    # `counts` always holds true totals.
+    rep = cfg.get("report", {}) or {}
+    cap = int(rep.get("max_findings_per_rule", 0) or 0)
+    aggregate = bool(rep.get("aggregate", False))
+    per_rule: Dict[str, List[Any]] = {}                 # rule_id -> [stored, severity, hidden]
+    groups: Dict[Tuple[str, str, Any], List[int]] = {}  # (rule, severity, file) -> [index, total]
+
+    def emit(rule_id: str, severity: str, template: str, args: Dict[str, Any] | None = None,
+             file: str | None = None, line: int | None = None, related=None):
         counts[severity] += 1
+        if aggregate:
+            g = groups.get((rule_id, severity, file))
+            if g is not None:
+                g[1] += 1
+                return
+        stat = per_rule.setdefault(rule_id, [0, severity, 0])
+        if cap and stat[0] >= cap:
+            stat[2] += 1
+            return
+        stat[0] += 1
+        if aggregate:
+            groups[(rule_id, severity, file)] = [len(findings), 1]
+        findings.append(Finding(rule_id=rule_id, severity=severity, template=template, args=args or {},
+                                file=file, line=line, related_ids=related or []))
 
-    id_req_re = re.compile(cfg["id_formats"]["requirement"]) if cfg.get("id_formats", {}).get("requirement") else None
     id_test_re = re.compile(cfg["id_formats"]["test"]) if cfg.get("id_formats", {}).get("test") else None
+    rules = cfg.get("rules", {})
 
     # 1) REQ_ID_FORMAT + UNIQUE_IDS + SEQUENCE_GAPS + REQUIRED_FIELDS + MISSING_TEST_LINKS + RISK_COVERAGE_MIN
-    seen_req = {}
-    seq_numbers = []
-    for r in model.requirements:
-        if id_req_re and not id_req_re.match(r.id):
-            emit("REQ_ID_FORMAT", _severity(cfg, "REQ_ID_FORMAT"), f"Requirement ID '{r.id}' does not match pattern", r.file, r.line, [r.id])
+    sev_unique = _severity(cfg, "UNIQUE_IDS")
+    seen_req: Dict[str, str] = {}
+
+    def check_unique(r) -> None:
         if r.id in seen_req:
-            emit("UNIQUE_IDS", _severity(cfg, "UNIQUE_IDS"), f"Duplicate requirement ID '{r.id}' also in {seen_req[r.id]}", r.file, r.line, [r.id])
+            emit("UNIQUE_IDS", sev_unique, "Duplicate requirement ID '{id}' also in {where}",
+                 {"id": r.id, "where": seen_req[r.id]}, r.file, r.line, [r.id])
         else:
             seen_req[r.id] = f"{r.file}:{r.line}"
-        m = re.search(r"(\d+)$", r.id)
-        if m:
-            seq_numbers.append(int(m.group(1)))
 
-        required = set(cfg.get("rules", {}).get("REQUIRED_FIELDS", {}).get("fields", ["id","title","risk"]))
-        missing = [f for f in required if getattr(r, f, None) in (None, "")]
-        if missing:
-            emit("REQUIRED_FIELDS", _severity(cfg, "REQUIRED_FIELDS"), f"Missing fields {missing} for {r.id}", r.file, r.line, [r.id])
-
-        if not r.tests:
-            emit("MISSING_TEST_LINKS", _severity(cfg, "MISSING_TEST_LINKS"), f"{r.id} has no linked tests", r.file, r.line, [r.id])
+    spec = _local_spec(model, cfg)
+    required = spec["required"]
+    mins = spec["mins"]
+    ambiguous: List[Requirement] = []
 
-        if r.risk:
-            mins = cfg.get("rules", {}).get("RISK_COVERAGE_MIN", {}).get("min_tests", {})
+    def report_requirement(r: Requirement, mask: int, missing: List[str]) -> None:
+        """Emit the findings flagged in `mask` for r, with UNIQUE_IDS in its report slot."""
+        if mask & _BAD_ID:
+            emit("REQ_ID_FORMAT", spec["sev_id"], "Requirement ID '{id}' does not match pattern",
+                 {"id": r.id}, r.file, r.line, [r.id])
+        check_unique(r)
+        if not mask:
+            return
+        if mask & _MISSING_FIELDS:
+            emit("REQUIRED_FIELDS", spec["sev_required"], "Missing fields {missing} for {id}",
+                 {"missing": missing, "id": r.id}, r.file, r.line, [r.id])
+        if mask & _NO_TESTS:
+            emit("MISSING_TEST_LINKS", spec["sev_links"], "{id} has no linked tests",
+                 {"id": r.id}, r.file, r.line, [r.id])
+        if mask & _LOW_COVERAGE:
             need = mins.get(str(r.risk).lower())
-            if isinstance(need, int) and len(r.tests) < need:
-                emit("RISK_COVERAGE_MIN", cfg.get("rules", {}).get("RISK_COVERAGE_MIN", {}).get("severity", "error"),
-                     f"{r.id} (risk={r.risk}) requires ≥{need} tests, found {len(r.tests)}", r.file, r.line, [r.id])
+            emit("RISK_COVERAGE_MIN", spec["sev_risk"], "{id} (risk={risk}) requires ≥{need} tests, found {found}",
+                 {"id": r.id, "risk": r.risk, "need": need, "found": len(r.tests)},
+                 r.file, r.line, [r.id])
+        if mask & _AMBIGUOUS:
+            ambiguous.append(r)  # reported after the test rules
+
+    # Per-requirement checks are pure functions of a few fields, so with engine.workers > 1
+    # (and more than one CPU) chunks of plain field tuples are checked in a process pool.
+    # Workers return only (row, mask, missing) for flagged rows; findings are built here,
+    # in input order, so output matches a serial run.
+    reqs = model.requirements
+    ecfg = cfg.get("engine", {}) or {}
+    size = max(1, int(ecfg.get("chunk_size", 20000) or 20000))
+    workers = int(ecfg.get("workers", 1) or 0) or (os.cpu_count() or 1)
+    get_row = _row_getter(required)
+    seq_numbers: set[int] = set()
+    declared: set[str] = set()
+    if workers > 1 and len(reqs) > size and (os.cpu_count() or 1) > 1:
+        chunks = [reqs[i:i + size] for i in range(0, len(reqs), size)]
+        rows = [[get_row(r) for r in chunk] for chunk in chunks]
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            partials = list(pool.map(partial(_check_chunk, spec), rows))
+        for chunk, (hits, seqs, chunk_declared) in zip(chunks, partials):
+            flagged = {j: (mask, missing) for j, mask, missing in hits}
+            for j, r in enumerate(chunk):
+                mask, missing = flagged.get(j, _CLEAN)
+                report_requirement(r, mask, missing)
+            seq_numbers |= seqs
+            declared |= chunk_declared
+    else:
+        check = _make_checker(spec)
+        want_declared = spec["want_declared"]
+        for r in reqs:
+            mask, missing = check(get_row(r))
+            report_requirement(r, mask, missing)
+            m = _SEQ_RE.search(r.id)
+            if m:
+                seq_numbers.add(int(m.group(1)))
+            if want_declared:
+                declared.update(r.tests)
 
     if seq_numbers:
-        gaps = _find_gaps(sorted(set(seq_numbers)))
+        gaps = _find_gaps(sorted(seq_numbers))
         if gaps:
-            emit("SEQUENCE_GAPS", cfg.get("rules", {}).get("SEQUENCE_GAPS", {}).get("severity", "warning"),
-                 f"Sequence gaps detected: {gaps}")
+            emit("SEQUENCE_GAPS", rules.get("SEQUENCE_GAPS", {}).get("severity", "warning"),
+                 "Sequence gaps detected: {gaps}", {"gaps": gaps})
 
     # 2) TEST_ID_FORMAT + ORPHAN_TESTS
+    sev_test_id = _severity(cfg, "TEST_ID_FORMAT")
+    sev_orphan = _severity(cfg, "ORPHAN_TESTS")
     for t in model.tests:
         if id_test_re and not id_test_re.match(t.id):
-            emit("TEST_ID_FORMAT", _severity(cfg, "TEST_ID_FORMAT"), f"Test ID '{t.id}' does not match pattern", t.file, t.line, [t.id])
+            emit("TEST_ID_FORMAT", sev_test_id, "Test ID '{id}' does not match pattern",
+                 {"id": t.id}, t.file, t.line, [t.id])
         if not t.requirements:
-            emit("ORPHAN_TESTS", _severity(cfg, "ORPHAN_TESTS"), f"Test '{t.id}' not linked to any requirement", t.file, t.line, [t.id])
-
-    # 3) AMBIGUOUS_TERMS (light heuristic on titles)
-    lex_pl = {"powinno", "może", "szybko", "łatwo", "intuicyjne"}
-    lex_en = {"should", "may", "quickly", "easily", "user-friendly", "robust"}
-    langs = set(cfg.get("rules", {}).get("AMBIGUOUS_TERMS", {}).get("languages", []))
-    for r in model.requirements:
-        text = f"{r.title}".lower()
-        hit = None
-        if "pl" in langs and any(w in text for w in lex_pl):
-            hit = "pl"
-        if "en" in langs and any(w in text for w in lex_en):
-            hit = hit or "en"
-        if hit:
-            emit("AMBIGUOUS_TERMS", cfg.get("rules", {}).get("AMBIGUOUS_TERMS", {}).get("severity", "warning"),
-                 f"Ambiguous terms in {r.id}: '{r.title}'", r.file, r.line, [r.id])
+            emit("ORPHAN_TESTS", sev_orphan, "Test '{id}' not linked to any requirement",
+                 {"id": t.id}, t.file, t.line, [t.id])
+
+    # 3) AMBIGUOUS_TERMS (light heuristic on titles, checked with the rules above)
+    sev_amb = spec["sev_amb"]
+    for r in ambiguous:
+        emit("AMBIGUOUS_TERMS", sev_amb, "Ambiguous terms in {id}: '{title}'",
+             {"id": r.id, "title": r.title}, r.file, r.line, [r.id])
 
     # 4) JUnit existence check (optional)
     if model.junit_tests:
-        declared = {t for r in model.requirements for t in r.tests}
         missing = sorted([t for t in declared if t not in model.junit_tests])
         if missing:
-            emit("TEST_MISSING_IN_JUNIT", "warning", f"Declared tests not found in JUnit: {', '.join(missing)}")
+            emit("TEST_MISSING_IN_JUNIT", "warning", "Declared tests not found in JUnit: {missing}",
+                 {"missing": ", ".join(missing)})
 
+    if aggregate:
+        _collapse_groups(findings, groups)
+    for rule_id, (_, severity, hidden) in per_rule.items():
+        if hidden:
+            findings.append(Finding(rule_id=rule_id, severity=severity,
+                                    template="... and {more} more {rule} findings",
+                                    args={"more": hidden, "rule": rule_id},
+                                    count=hidden))
     return findings, counts
 
+def _collapse_groups(findings: List[Finding], groups: Dict[Tuple[str, str, Any], List[int]]) -> None:
+    """Turn the first finding of each (rule, severity, file) group into a group summary."""
+    for idx, total in groups.values():
+        if total > 1:
+            f = findings[idx]
+            findings[idx] = f.model_copy(update={
+                "template": "{n} findings, e.g. " + f.template,
+                "args": {**f.args, "n": total},
+                "count": total,
+            })
+
+def _local_spec(model: Model, cfg: Dict) -> Dict[str, Any]:
+    """Picklable settings for the per-requirement rules (see _make_checker)."""
+    rules = cfg.get("rules", {})
+    risk_cfg = rules.get("RISK_COVERAGE_MIN", {})
+    amb_cfg = rules.get("AMBIGUOUS_TERMS", {})
+    return {
+        "id_regex": cfg.get("id_formats", {}).get("requirement") or None,
+        "sev_id": _severity(cfg, "REQ_ID_FORMAT"),
+        "sev_required": _severity(cfg, "REQUIRED_FIELDS"),
+        "sev_links": _severity(cfg, "MISSING_TEST_LINKS"),
+        "sev_risk": risk_cfg.get("severity", "error"),
+        "mins": dict(risk_cfg.get("min_tests", {})),
+        "required": list(dict.fromkeys(rules.get("REQUIRED_FIELDS", {}).get("fields", ["id", "title", "risk"]))),
+        "langs": sorted(set(amb_cfg.get("languages", []))),
+        "sev_amb": amb_cfg.get("severity", "warning"),
+        "want_declared": bool(model.junit_tests),
+    }
+
+def _row_getter(required: List[str]) -> Callable[[Requirement], tuple]:
+    """Return r -> (id, title, risk, tests, *required_values), the plain row _make_checker reads."""
+    names = ("id", "title", "risk", "tests", *required)
+    if all(f in Requirement.model_fields for f in required):
+        return attrgetter(*names)
+    return lambda r: tuple(getattr(r, f, None) for f in names)
+
+def _make_checker(spec: Dict[str, Any]) -> Callable[[tuple], Tuple[int, List[str]]]:
+    """
+    Build check(row) -> (mask, missing_fields) for the per-requirement rules, where row comes
+    from _row_getter and `mask` is a combination of the _BAD_ID.._AMBIGUOUS bits.
+    """
+    id_req_re = re.compile(spec["id_regex"]) if spec["id_regex"] else None
+    mins = spec["mins"]
+    required = spec["required"]
+    lexicon = tuple((_LEX_PL if "pl" in spec["langs"] else frozenset())
+                    | (_LEX_EN if "en" in spec["langs"] else frozenset()))
+
+    def check(row: tuple) -> Tuple[int, List[str]]:
+        rid, title, risk, tests = row[:4]
+        mask = 0
+        if id_req_re and not id_req_re.match(rid):
+            mask |= _BAD_ID
+        missing = [f for f, v in zip(required, row[4:]) if v in (None, "")]
+        if missing:
+            mask |= _MISSING_FIELDS
+        if not tests:
+            mask |= _NO_TESTS
+        if risk:
+            need = mins.get(str(risk).lower())
+            if isinstance(need, int) and len(tests) < need:
+                mask |= _LOW_COVERAGE
+        if lexicon:
+            text = f"{title}".lower()
+            if any(w in text for w in lexicon):
+                mask |= _AMBIGUOUS
+        return mask, missing
+    return check
+
+def _check_chunk(spec: Dict[str, Any], rows: List[tuple]) -> Tuple[List[tuple], set[int], set[str]]:
+    """
+    Process-pool worker: check rows built by _row_getter.
+    Returns ([(row_index, mask, missing_fields)] for flagged rows only,
+    sequence numbers, declared test IDs).
+    """
+    check = _make_checker(spec)
+    want_declared = spec["want_declared"]
+    hits: List[tuple] = []
+    seqs: set[int] = set()
+    declared: set[str] = set()
+    for j, row in enumerate(rows):
+        mask, missing = check(row)
+        if mask:
+            hits.append((j, mask, missing))
+        m = _SEQ_RE.search(row[0])
+        if m:
+            seqs.add(int(m.group(1)))
+        if want_declared:
+            declared.update(row[3])
+    return hits, seqs, declared
+
 def _find_gaps(nums: list[int]) -> list[str]:
     gaps = []
     for i in range(len(nums)-1):
@@ -0,0 +1,69 @@
+import json
+import re
+from pathlib import Path
+
+from speclint.core.models import Finding
+from speclint.reporters.emit import write_html_report
+
+
+def _findings(n: int):
+    # errors first once sorted; every third finding has no file
+    return [Finding(rule_id="R1" if i % 2 else "R2", severity="error" if i < n // 2 else "warning",
+                    message=f"finding {i}", file=None if i % 3 == 0 else "a.md", line=i,
+                    count=2 if i == 1 else 1)
+            for i in range(n)]
+
+
+def _load(path: Path, callback: str):
+    text = path.read_text(encoding="utf-8")
+    m = re.fullmatch(rf"{callback}\((?:\d+,)?(.*)\);\n", text, re.S)
+    assert m, text[:80]
+    return json.loads(m.group(1))
+
+
+def _counts(findings):
+    counts = {"error": 0, "warning": 0, "info": 0}
+    for f in findings:
+        counts[f.severity] += f.count
+    return counts
+
+
+def test_chunks_and_manifest(tmp_path):
+    findings = _findings(10)
+    write_html_report(findings, _counts(findings), tmp_path, chunk_size=4)
+    data = tmp_path / "data"
+    assert sorted(p.name for p in data.glob("chunk-*.js")) == [
+        "chunk-00000.js", "chunk-00001.js", "chunk-00002.js"]
+    manifest = _load(data / "manifest.js", "speclintManifest")
+    assert [c["size"] for c in manifest["chunks"]] == [4, 4, 2]
+    assert manifest["total"] == 10
+    assert manifest["counts"] == {"error": 6, "warning": 5, "info": 0}
+
+    rows = [r for c in manifest["chunks"] for r in _load(data / c["name"], "speclintChunk")]
+    assert len(rows) == 10
+    assert [r[0] for r in rows] == ["error"] * 5 + ["warning"] * 5
+    index = manifest["index"]
+    assert index["severity"]["error"] == {"count": 6, "chunks": [0, 1]}
+    assert index["severity"]["warning"] == {"count": 5, "chunks": [1, 2]}
+    assert index["rule"]["R1"]["count"] == 6 and index["rule"]["R2"]["count"] == 5
+    # findings without a file are indexed under "(none)" but written with an empty file cell
+    assert index["file"]["(none)"]["count"] == 4
+    assert index["file"]["a.md"]["count"] == 7
+    assert sum(1 for r in rows if r[3] == "") == 4
+    for key, entries in index.items():
+        for value, entry in entries.items():
+            col = {"severity": 0, "rule": 1, "file": 3}[key]
+            expected = sorted({i for i, c in enumerate(manifest["chunks"])
+                               for r in _load(data / c["name"], "speclintChunk")
+                               if (r[col] or "(none)") == value})
+            assert entry["chunks"] == expected, (key, value)
+    assert (tmp_path / "index.html").exists()
+
+
+def test_rerun_removes_stale_chunks(tmp_path):
+    findings = _findings(10)
+    write_html_report(findings, _counts(findings), tmp_path, chunk_size=3)
+    assert len(list((tmp_path / "data").glob("chunk-*.js"))) == 4
+    write_html_report(findings[:2], _counts(findings[:2]), tmp_path, chunk_size=3)
+    assert [p.name for p in (tmp_path / "data").glob("chunk-*.js")] == ["chunk-00000.js"]
+    assert len(_load(tmp_path / "data" / "manifest.js", "speclintManifest")["chunks"]) == 1
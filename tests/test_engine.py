@@ -0,0 +1,112 @@
+import copy
+
+import pytest
+from typer.testing import CliRunner
+
+from speclint.cli import app
+from speclint.core.config import DEFAULT_CONFIG
+from speclint.core.models import Finding, Model, Requirement
+from speclint.rules import engine
+from speclint.rules.engine import run_rules
+
+
+def _cfg(**report):
+    cfg = copy.deepcopy(DEFAULT_CONFIG)
+    cfg["report"].update(report)
+    return cfg
+
+
+def _model():
+    # "REQ-1" style IDs fail the default ^REQ-[0-9]{3,}$ pattern; no requirement has tests.
+    reqs = [Requirement(id=f"REQ-{i}", title=f"Title {i}", risk="low", tests=[],
+                        file="a.md" if i % 2 else "b.md", line=i) for i in range(1, 8)]
+    return Model(requirements=reqs)
+
+
+def test_uncapped_by_default():
+    findings, counts = run_rules(_model(), _cfg())
+    assert sum(1 for f in findings if f.rule_id == "REQ_ID_FORMAT") == 7
+    assert all(f.count == 1 for f in findings)
+    assert counts["error"] == sum(f.count for f in findings if f.severity == "error")
+
+
+def test_cap_adds_and_more_entry_and_keeps_true_counts():
+    full, full_counts = run_rules(_model(), _cfg())
+    findings, counts = run_rules(_model(), _cfg(max_findings_per_rule=2))
+    assert counts == full_counts
+    ids = [f for f in findings if f.rule_id == "REQ_ID_FORMAT"]
+    assert [f.count for f in ids] == [1, 1, 5]
+    assert ids[-1].message == "... and 5 more REQ_ID_FORMAT findings"
+    # shown entries plus summaries still account for every finding
+    assert sum(f.count for f in findings) == sum(full_counts.values())
+
+
+def test_aggregate_groups_by_rule_and_file():
+    findings, counts = run_rules(_model(), _cfg(aggregate=True))
+    ids = {f.file: f for f in findings if f.rule_id == "REQ_ID_FORMAT"}
+    assert ids["a.md"].count == 4 and ids["b.md"].count == 3
+    assert ids["a.md"].message == "4 findings, e.g. Requirement ID 'REQ-1' does not match pattern"
+    assert sum(f.count for f in findings) == sum(counts.values())
+
+
+def test_cap_limits_aggregated_groups():
+    findings, counts = run_rules(_model(), _cfg(aggregate=True, max_findings_per_rule=1))
+    ids = [f for f in findings if f.rule_id == "REQ_ID_FORMAT"]
+    assert [(f.file, f.count) for f in ids] == [("a.md", 4), (None, 3)]
+    assert sum(f.count for f in findings) == sum(counts.values())
+
+
+def test_finding_accepts_plain_message_and_round_trips():
+    f = Finding(rule_id="R", severity="error", message="literal {braces}")
+    assert f.message == "literal {braces}"
+    d = f.model_dump()
+    assert list(d) == ["rule_id", "severity", "message", "file", "line", "related_ids"]
+    assert Finding.model_validate(d) == f
+    g = Finding(rule_id="R", severity="warning", template="{n} x", args={"n": 2}, count=3)
+    assert g.model_dump()["count"] == 3
+    assert Finding.model_validate(g.model_dump()).model_dump() == g.model_dump()
+
+
+def _mixed_model():
+    # 3 chunks of 4 at chunk_size=4; duplicate IDs sit in different chunks (REQ-003 at 2/5,
+    # REQ-006 at 6/9), there are sequence gaps, ambiguous titles and tests missing from JUnit.
+    specs = [("REQ-001", "high", ["TC-001"]), ("REQ-002", "low", []), ("REQ-003", "low", ["TC-003"]),
+             ("REQ-5", "medium", []), ("REQ-006", "low", ["TC-006"]), ("REQ-003", "high", []),
+             ("REQ-006", "low", ["TC-007"]), ("REQ-010", None, ["TC-010"]), ("REQ-011", "low", []),
+             ("REQ-006", "medium", ["TC-011", "TC-012"]), ("REQ-014", "high", ["TC-014"])]
+    reqs = [Requirement(id=rid, title=f"Title {i} should be robust" if i % 3 else f"Title {i}",
+                        risk=risk, tests=tests, file=f"f{i % 3}.md", line=i)
+            for i, (rid, risk, tests) in enumerate(specs)]
+    return Model(requirements=reqs, junit_tests={"TC-001", "TC-006", "TC-011"})
+
+
+@pytest.mark.parametrize("report", [{}, {"max_findings_per_rule": 2}, {"aggregate": True},
+                                    {"aggregate": True, "max_findings_per_rule": 1}])
+def test_process_pool_matches_serial_run(monkeypatch, report):
+    monkeypatch.setattr(engine.os, "cpu_count", lambda: 2)  # the pool is skipped on 1 CPU
+    serial_cfg = _cfg(**report)
+    serial, serial_counts = run_rules(_mixed_model(), serial_cfg)
+    pool_cfg = _cfg(**report)
+    pool_cfg["engine"] = {"workers": 2, "chunk_size": 4}
+    calls, pool = [], engine.ProcessPoolExecutor
+    monkeypatch.setattr(engine, "ProcessPoolExecutor", lambda **kw: calls.append(kw) or pool(**kw))
+    findings, counts = run_rules(_mixed_model(), pool_cfg)
+    assert calls == [{"max_workers": 2}]
+    assert counts == serial_counts
+    assert [f.model_dump() for f in findings] == [f.model_dump() for f in serial]
+    rules = {f.rule_id for f in serial}
+    assert {"UNIQUE_IDS", "SEQUENCE_GAPS", "AMBIGUOUS_TERMS", "TEST_MISSING_IN_JUNIT"} <= rules
+
+
+def test_exit_code_reflects_capped_findings(tmp_path):
+    (tmp_path / "reqs.md").write_text(
+        "".join(f"## REQ-00{i} Title {i}\nrisk: low\n" for i in range(1, 6)), encoding="utf-8")
+    out = tmp_path / "out"
+    (tmp_path / ".speclint.yml").write_text(
+        f'report:\n  formats: ["cli", "json"]\n  output_dir: "{out.as_posix()}"\n'
+        "  max_findings_per_rule: 1\n", encoding="utf-8")
+    result = CliRunner().invoke(app, [str(tmp_path)])
+    assert result.exit_code == 1
+    # 5 MISSING_TEST_LINKS + 5 RISK_COVERAGE_MIN errors, even though only 1 of each is listed
+    assert "Summary: 10 errors" in result.output
+    assert "... and 4 more MISSING_TEST_LINKS findings" in result.output
@@ -0,0 +1,74 @@
+import copy
+from pathlib import Path
+
+import pytest
+
+from speclint.core.config import DEFAULT_CONFIG
+from speclint.parsers.md_req import _literal_prefix, parse_md_requirements
+
+
+def _parse(tmp_path: Path, text: str, **md):
+    p = tmp_path / "reqs.md"
+    p.write_text(text, encoding="utf-8")
+    cfg = copy.deepcopy(DEFAULT_CONFIG)
+    cfg["inputs"]["md"].update(md)
+    return parse_md_requirements(p, cfg)
+
+
+@pytest.mark.parametrize("pattern, ignore_case, expected", [
+    (r"^##\s+(REQ-[0-9]+)\s+(.*)$", False, "##"),
+    (r"^risk:\s*(\w+)", True, "risk:"),
+    (r"^RISK:", True, "risk:"),
+    (r"^#{2}\s+(REQ-\d+)\s+(.*)$", False, ""),
+    (r"^## ?(REQ-\d+)\s+(.*)$", False, "##"),
+    (r"^ri?sk:\s*(\w+)", True, "r"),
+    (r"^risk+:\s*(\w+)", True, "risk"),
+    (r"^\#\#\s+(REQ-\d+)\s+(.*)$", False, ""),
+    (r"^risk:|^severity:", True, ""),
+    (r"^(?i:risk):\s*(\w+)", True, ""),
+    (r"risk:\s*(\w+)", True, ""),
+    (r"^- risk:\s*(\w+)", True, "- risk:"),
+])
+def test_literal_prefix(pattern, ignore_case, expected):
+    assert _literal_prefix(pattern, ignore_case) == expected
+
+
+def test_fields_tags_and_description(tmp_path):
+    reqs = _parse(tmp_path, """\
+## REQ-001 Login works
+Risk: HIGH
+TESTS: TC-001, TC-002
+tags: auth | core,  web
+Users log in with email and password.
+
+Lockout after five failures.
+## Other header
+Unrelated prose.
+## REQ-002 Logout works
+# note
+tests: TC-003
+""")
+    assert [(r.id, r.line) for r in reqs] == [("REQ-001", 1), ("REQ-002", 10)]
+    first, second = reqs
+    assert first.risk == "high"
+    assert first.tests == ["TC-001", "TC-002"]
+    assert first.tags == ["auth", "core", "web"]
+    assert first.description == "Users log in with email and password.\n\nLockout after five failures."
+    assert second.tests == ["TC-003"]
+    assert second.description is None
+
+
+@pytest.mark.parametrize("md", [
+    {"header_regex": r"^#{2}\s+(REQ-[0-9]+)\s+(.*)$"},
+    {"header_regex": r"^\#\#\s+(REQ-[0-9]+)\s+(.*)$"},
+    {"risk_regex": r"^ri?sk:\s*(\w+)"},
+    {"risk_regex": r"^(?:risk|severity):\s*(\w+)"},
+    {"risk_regex": r"^risk:\s*(\w+)|^severity:\s*(\w+)"},
+    {"risk_regex": r"^(?i:RISK):\s*(\w+)"},
+    {"risk_regex": r"^- risk:\s*(\w+)", "tests_regex": r"^- tests:\s*(.*)$"},
+])
+def test_custom_regexes_still_match(tmp_path, md):
+    risk_line = "- risk: low" if "- risk" in md.get("risk_regex", "") else "risk: low"
+    tests_line = "- tests: TC-009" if "- tests" in md.get("tests_regex", "") else "tests: TC-009"
+    reqs = _parse(tmp_path, f"## REQ-009 Custom\n{risk_line}\n{tests_line}\n", **md)
+    assert [(r.id, r.title, r.risk, r.tests) for r in reqs] == [("REQ-009", "Custom", "low", ["TC-009"])]
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+import pytest
+from yaml.composer import ComposerError
+
+from speclint.core.config import DEFAULT_CONFIG
+from speclint.parsers.yaml_req import parse_yaml_requirements
+
+
+def _parse(tmp_path: Path, text: str):
+    p = tmp_path / "reqs.yaml"
+    p.write_text(text, encoding="utf-8")
+    return parse_yaml_requirements(p, DEFAULT_CONFIG)
+
+
+def test_lines_point_to_item_start(tmp_path):
+    reqs = _parse(tmp_path, """\
+project: demo
+requirements:
+  - id: REQ-001
+    title: One
+    risk: high
+    tests: [TC-001, TC-002]
+  - id: REQ-002
+    title: Two
+    risk: low
+    tests: "TC-003 | TC-004"
+""")
+    assert [(r.id, r.line) for r in reqs] == [("REQ-001", 3), ("REQ-002", 7)]
+    assert reqs[1].tests == ["TC-003", "TC-004"]
+
+
+def test_requirements_value_may_be_an_alias(tmp_path):
+    reqs = _parse(tmp_path, """\
+shared: &all
+  - id: REQ-001
+    title: One
+    risk: high
+requirements: *all
+""")
+    assert [(r.id, r.line) for r in reqs] == [("REQ-001", 2)]
+
+
+def test_alias_item_reports_its_own_line(tmp_path):
+    reqs = _parse(tmp_path, """\
+base: &r1 {id: REQ-001, title: One, risk: low}
+requirements:
+  - id: REQ-002
+    title: Two
+    risk: low
+  - *r1
+""")
+    assert [(r.id, r.line) for r in reqs] == [("REQ-002", 3), ("REQ-001", 6)]
+
+
+def test_multiple_documents_are_rejected(tmp_path):
+    with pytest.raises(ComposerError):
+        _parse(tmp_path, "- {id: REQ-001, title: One}\n---\n- {id: REQ-002, title: Two}\n")